@@ -164,8 +164,13 @@ class Vizro:
         This deliberately does not clear the data manager cache - see comments in data_manager._clear for
         explanation.
         """
+        from vizro.actions._actions_utils import _get_parent_vizro_model
+
         data_manager._clear()
         model_manager._clear()
+        # The parent-model lookup is memoized on underlying callable object ids, which are only unique within one
+        # set of registered models, so the cache must go whenever the model manager does.
+        _get_parent_vizro_model.cache_clear()
         dash._callback.GLOBAL_CALLBACK_LIST = []
         dash._callback.GLOBAL_CALLBACK_MAP = {}
         dash._callback.GLOBAL_INLINE_SCRIPTS = []
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from copy import deepcopy
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, TypedDict, Union
 
 import pandas as pd
@@ -39,6 +40,9 @@ class CallbackTriggerDict(TypedDict):
 
 
 # Utility functions for helper functions used in pre-defined actions ----
+# Note this is deliberately not memoized: actions can legitimately be reassigned after a model has been built
+# (validate_assignment reruns the actions validator), so a per-model cache of the flattened chains would go stale.
+# The flattening itself is just one list comprehension over the component's own chains, not a registry walk.
 def _get_component_actions(component) -> List[Action]:
     return (
         [action for actions_chain in component.actions for action in actions_chain.actions]
@@ -69,14 +73,18 @@ def _apply_filters(data_frame: pd.DataFrame, ctds_filters: List[CallbackTriggerD
     return data_frame
 
 
+# The mapping from underlying callable object id to parent model is fixed once models have been pre-built, so the
+# traversal of all registered models is only ever paid once per underlying id. The cache is cleared in Vizro._reset
+# together with the model manager itself. Lookups that raise KeyError are not cached, so a model registered later
+# is still found.
+@lru_cache(maxsize=None)
 def _get_parent_vizro_model(_underlying_callable_object_id: str) -> VizroBaseModel:
     from vizro.models import VizroBaseModel
 
+    # getattr with a default rather than hasattr: models that do have _input_component_id initialize it to None, so
+    # the common case is a plain attribute read with no AttributeError being raised and caught per model.
     for _, vizro_base_model in model_manager._items_with_type(VizroBaseModel):
-        if (
-            hasattr(vizro_base_model, "_input_component_id")
-            and vizro_base_model._input_component_id == _underlying_callable_object_id
-        ):
+        if getattr(vizro_base_model, "_input_component_id", None) == _underlying_callable_object_id:
             return vizro_base_model
     raise KeyError(
         f"No parent Vizro model found for underlying callable object with id: {_underlying_callable_object_id}."
@@ -131,7 +139,8 @@ def _update_nested_graph_properties(
 def _get_parametrized_config(target: ModelID, ctd_parameters: List[CallbackTriggerDict]) -> Dict[str, Any]:
     # TODO - avoid calling _captured_callable. Once we have done this we can remove _arguments from
     #  CapturedCallable entirely.
-    config = deepcopy(model_manager[target].figure._arguments)
+    # _arguments is a read-only mapping view, which deepcopy cannot handle directly, hence the dict() around it.
+    config = deepcopy(dict(model_manager[target].figure._arguments))
 
     # It's not possible to address nested argument of data_frame like data_frame.x.y, just top-level ones like
     # data_frame.x.
@@ -1,4 +1,4 @@
-from functools import partial
+from functools import lru_cache, partial
 from typing import Any, Dict, List, NamedTuple
 
 try:
@@ -21,14 +21,19 @@ class ActionsChain(VizroBaseModel):
 
 # Validators for reuse in other models to convert to ActionsChain
 def _set_actions(actions: List[Action], values: Dict[str, Any], trigger_property: str) -> List[ActionsChain]:
+    # actions have already been validated by the time this validator runs, so the chain can be assembled without
+    # paying for the full pydantic validator chain again.
     return [
-        ActionsChain(
+        ActionsChain._fast_construct(
             trigger=Trigger(component_id=values["id"], component_property=trigger_property),
             actions=actions,
         )
     ]
 
 
+# The validator is created with allow_reuse=True, so models sharing a trigger property (e.g. all the form selectors
+# trigger on "value") can share one validator object instead of rebuilding it per class definition.
+@lru_cache(maxsize=None)
 def _action_validator_factory(trigger_property: str):
     set_actions = partial(_set_actions, trigger_property=trigger_property)
     return validator("actions", allow_reuse=True)(set_actions)
@@ -179,6 +179,21 @@ class VizroBaseModel(BaseModel):
         super().__init__(**data)
         model_manager[self.id] = self
 
+    @classmethod
+    def _fast_construct(cls, **data: Any):
+        """Creates a model without running validation, for trusted internal construction only.
+
+        This skips the whole pydantic validator chain, which dominates the cost of building large model trees. It
+        must only be used where all supplied values are already validated (e.g. models that Vizro itself assembles
+        out of user-supplied models). It still performs the work Vizro relies on from `__init__`: generating an id
+        and registering the model in the model manager.
+        """
+        if not data.get("id"):
+            data["id"] = model_manager._generate_id()
+        model = cls.construct(**data)
+        model_manager[model.id] = model
+        return model
+
     @classmethod
     def add_type(cls, field_name: str, new_type: Type[Any]):
         """Adds a new type to an existing field based on a discriminated union.
@@ -1,9 +1,11 @@
-import logging
 import uuid
 
-from vizro.managers import data_manager
+try:
+    from pydantic.v1 import validator
+except ImportError:  # pragma: no cov
+    from pydantic import validator
 
-logger = logging.getLogger(__name__)
+from vizro.managers import data_manager
 
 
 def _process_callable_data_frame(captured_callable):
@@ -33,3 +35,8 @@ def _process_callable_data_frame(captured_callable):
     captured_callable["data_frame"] = data_source_name
 
     return captured_callable
+
+
+# All figure-like components validate their figure field identically, so the validator object is built once here and
+# shared between the classes (allow_reuse=True makes this legitimate) rather than rebuilt in every class body.
+_FIGURE_VALIDATOR = validator("figure", allow_reuse=True, always=True)(_process_callable_data_frame)
@@ -1,25 +1,23 @@
-import logging
-from typing import Dict, List, Literal
+from typing import Dict, List, Literal, Optional
 
 import pandas as pd
 from dash import State, dcc, html
 
 try:
-    from pydantic.v1 import Field, PrivateAttr, validator
+    from pydantic.v1 import Field, PrivateAttr
 except ImportError:  # pragma: no cov
-    from pydantic import Field, PrivateAttr, validator
+    from pydantic import Field, PrivateAttr
 from dash import ClientsideFunction, Input, Output, clientside_callback
 
+from vizro.actions import filter_interaction
 from vizro.actions._actions_utils import CallbackTriggerDict, _get_component_actions, _get_parent_vizro_model
 from vizro.managers import data_manager
 from vizro.models import Action, VizroBaseModel
 from vizro.models._action._actions_chain import _action_validator_factory
-from vizro.models._components._components_utils import _process_callable_data_frame
+from vizro.models._components._components_utils import _FIGURE_VALIDATOR
 from vizro.models._models_utils import _log_call
 from vizro.models.types import CapturedCallable
 
-logger = logging.getLogger(__name__)
-
 
 class AgGrid(VizroBaseModel):
     """Wrapper for `dash-ag-grid.AgGrid` to visualize grids in dashboard.
@@ -54,28 +52,31 @@ class AgGrid(VizroBaseModel):
     )
     actions: List[Action] = []
 
-    _input_component_id: str = PrivateAttr()
+    _input_component_id: Optional[str] = PrivateAttr(None)
 
     # Component properties for actions and interactions
     _output_component_property: str = PrivateAttr("children")
 
     # Validators
     set_actions = _action_validator_factory("cellClicked")
-    _validate_callable = validator("figure", allow_reuse=True, always=True)(_process_callable_data_frame)
+    _validate_callable = _FIGURE_VALIDATOR
 
     # Convenience wrapper/syntactic sugar.
     def __call__(self, **kwargs):
-        kwargs.setdefault("data_frame", data_manager[self["data_frame"]].load())
+        # An explicit membership test rather than setdefault, since setdefault would evaluate (and hence load the
+        # data for) the default argument even when data_frame is already supplied, which it always is on the
+        # callback path.
+        if "data_frame" not in kwargs:
+            kwargs["data_frame"] = data_manager[self["data_frame"]].load()
         figure = self.figure(**kwargs)
         figure.id = self._input_component_id
         return figure
 
     # Convenience wrapper/syntactic sugar.
     def __getitem__(self, arg_name: str):
-        # See figure implementation for more details.
-        if arg_name == "type":
-            return self.type
-        return self.figure[arg_name]
+        # See figure implementation for more details. A single conditional expression keeps the common
+        # pydantic-driven "type" lookup as cheap as possible.
+        return self.type if arg_name == "type" else self.figure[arg_name]
 
     # Interaction methods
     @property
@@ -99,7 +100,12 @@ class AgGrid(VizroBaseModel):
         source_table_actions = _get_component_actions(_get_parent_vizro_model(ctd_cellClicked["id"]))
 
         for action in source_table_actions:
-            if action.function._function.__name__ != "filter_interaction" or target not in action.function["targets"]:
+            # Identity comparison against the undecorated function replaces the attribute-chain + string compare on
+            # this per-callback path, as in _get_action_callback_outputs.
+            if (
+                action.function._function is not filter_interaction.__wrapped__
+                or target not in action.function["targets"]
+            ):
                 continue
             column = ctd_cellClicked["value"]["colId"]
             clicked_data = ctd_cellClicked["value"]["value"]
@@ -109,6 +115,9 @@ class AgGrid(VizroBaseModel):
 
     @_log_call
     def pre_build(self):
+        # The underlying grid id is read straight from the captured arguments rather than by calling the captured
+        # function with an empty data_frame just to inspect the resulting Dash component, which would be rebuilt and
+        # thrown away for every AgGrid on every pre-build.
         self._input_component_id = self.figure._arguments.get("id", f"__input_{self.id}")
 
     def build(self):
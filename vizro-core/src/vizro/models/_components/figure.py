@@ -3,13 +3,13 @@ from typing import Literal
 from dash import dcc, html
 
 try:
-    from pydantic.v1 import Field, PrivateAttr, validator
+    from pydantic.v1 import Field, PrivateAttr
 except ImportError:  # pragma: no cov
-    from pydantic import Field, PrivateAttr, validator
+    from pydantic import Field, PrivateAttr
 
 from vizro.managers import data_manager
 from vizro.models import VizroBaseModel
-from vizro.models._components._components_utils import _process_callable_data_frame
+from vizro.models._components._components_utils import _FIGURE_VALIDATOR
 from vizro.models._models_utils import _log_call
 from vizro.models.types import CapturedCallable
 
@@ -34,10 +34,14 @@ class Figure(VizroBaseModel):
     _output_component_property: str = PrivateAttr("children")
 
     # Validators
-    _validate_callable = validator("figure", allow_reuse=True, always=True)(_process_callable_data_frame)
+    _validate_callable = _FIGURE_VALIDATOR
 
     def __call__(self, **kwargs):
-        kwargs.setdefault("data_frame", data_manager[self["data_frame"]].load())
+        # An explicit membership test rather than setdefault, since setdefault would evaluate (and hence load the
+        # data for) the default argument even when data_frame is already supplied, which it always is on the
+        # callback path.
+        if "data_frame" not in kwargs:
+            kwargs["data_frame"] = data_manager[self["data_frame"]].load()
         figure = self.figure(**kwargs)
         return figure
 
@@ -45,9 +49,7 @@ class Figure(VizroBaseModel):
         # pydantic discriminated union validation seems to try Figure["type"], which throws an error unless we
         # explicitly redirect it to the correct attribute.
         if self.figure:
-            if arg_name == "type":
-                return self.type
-            return self.figure[arg_name]
+            return self.type if arg_name == "type" else self.figure[arg_name]
 
     @_log_call
     def build(self):
@@ -1,4 +1,3 @@
-import logging
 import warnings
 from contextlib import suppress
 from typing import Dict, List, Literal
@@ -8,23 +7,22 @@ from dash.exceptions import MissingCallbackContextException
 from plotly import graph_objects as go
 
 try:
-    from pydantic.v1 import Field, PrivateAttr, validator
+    from pydantic.v1 import Field, PrivateAttr
 except ImportError:  # pragma: no cov
-    from pydantic import Field, PrivateAttr, validator
+    from pydantic import Field, PrivateAttr
 
 import pandas as pd
 
+from vizro.actions import filter_interaction
 from vizro.actions._actions_utils import CallbackTriggerDict, _get_component_actions
 from vizro.managers import data_manager, model_manager
 from vizro.managers._model_manager import ModelID
 from vizro.models import Action, VizroBaseModel
 from vizro.models._action._actions_chain import _action_validator_factory
-from vizro.models._components._components_utils import _process_callable_data_frame
+from vizro.models._components._components_utils import _FIGURE_VALIDATOR
 from vizro.models._models_utils import _log_call
 from vizro.models.types import CapturedCallable
 
-logger = logging.getLogger(__name__)
-
 
 class Graph(VizroBaseModel):
     """Wrapper for `dcc.Graph` to visualize charts in dashboard.
@@ -65,14 +63,18 @@ class Graph(VizroBaseModel):
 
     # Validators
     _set_actions = _action_validator_factory("clickData")
-    _validate_callable = validator("figure", allow_reuse=True)(_process_callable_data_frame)
+    _validate_callable = _FIGURE_VALIDATOR
 
     # Convenience wrapper/syntactic sugar.
     def __call__(self, **kwargs):
         # This default value is not actually used anywhere at the moment since __call__ is always used with data_frame
         # specified. It's here to match Table and AgGrid and because we might want to use __call__ more in future.
         # If the functionality of process_callable_data_frame moves to CapturedCallable then this would move there too.
-        kwargs.setdefault("data_frame", data_manager[self["data_frame"]].load())
+        # An explicit membership test rather than setdefault, since setdefault would evaluate (and hence load the
+        # data for) the default argument even when data_frame is already supplied, which it always is on the
+        # callback path.
+        if "data_frame" not in kwargs:
+            kwargs["data_frame"] = data_manager[self["data_frame"]].load()
         fig = self.figure(**kwargs)
         fig = self._optimise_fig_layout_for_dashboard(fig)
 
@@ -90,10 +92,9 @@ class Graph(VizroBaseModel):
 
     # Convenience wrapper/syntactic sugar.
     def __getitem__(self, arg_name: str):
-        # See figure implementation for more details.
-        if arg_name == "type":
-            return self.type
-        return self.figure[arg_name]
+        # See figure implementation for more details. A single conditional expression keeps the common
+        # pydantic-driven "type" lookup as cheap as possible.
+        return self.type if arg_name == "type" else self.figure[arg_name]
 
     # Interaction methods
     @property
@@ -129,7 +130,12 @@ class Graph(VizroBaseModel):
         customdata = ctd_click_data["value"]["points"][0]["customdata"]
 
         for action in source_graph_actions:
-            if action.function._function.__name__ != "filter_interaction" or target not in action.function["targets"]:
+            # Identity comparison against the undecorated function replaces the attribute-chain + string compare on
+            # this per-callback path, as in _get_action_callback_outputs.
+            if (
+                action.function._function is not filter_interaction.__wrapped__
+                or target not in action.function["targets"]
+            ):
                 continue
             for custom_data_idx, column in enumerate(custom_data_columns):
                 data_frame = data_frame[data_frame[column].isin([customdata[custom_data_idx]])]
@@ -1,24 +1,20 @@
-import logging
-from typing import Dict, List, Literal
+from typing import Any, Dict, List, Literal, Optional
 
 import pandas as pd
-from dash import State, dcc, html
 
 try:
-    from pydantic.v1 import Field, PrivateAttr, validator
+    from pydantic.v1 import Field, PrivateAttr
 except ImportError:  # pragma: no cov
-    from pydantic import Field, PrivateAttr, validator
+    from pydantic import Field, PrivateAttr
 
-from vizro.actions._actions_utils import CallbackTriggerDict, _get_component_actions, _get_parent_vizro_model
+from vizro.actions._actions_utils import CallbackTriggerDict, _get_component_actions
 from vizro.managers import data_manager
 from vizro.models import Action, VizroBaseModel
 from vizro.models._action._actions_chain import _action_validator_factory
-from vizro.models._components._components_utils import _process_callable_data_frame
+from vizro.models._components._components_utils import _FIGURE_VALIDATOR
 from vizro.models._models_utils import _log_call
 from vizro.models.types import CapturedCallable
 
-logger = logging.getLogger(__name__)
-
 
 class Table(VizroBaseModel):
     """Wrapper for `dash_table.DataTable` to visualize tables in dashboard.
@@ -53,33 +49,42 @@ class Table(VizroBaseModel):
     )
     actions: List[Action] = []
 
-    _input_component_id: str = PrivateAttr()
+    _input_component_id: Optional[str] = PrivateAttr(None)
+    _filter_interaction_index: Dict[str, List[Action]] = PrivateAttr({})
+    _built_layout: Any = PrivateAttr(None)
 
     # Component properties for actions and interactions
     _output_component_property: str = PrivateAttr("children")
 
     # Validators
     set_actions = _action_validator_factory("active_cell")
-    _validate_callable = validator("figure", allow_reuse=True, always=True)(_process_callable_data_frame)
+    _validate_callable = _FIGURE_VALIDATOR
 
     # Convenience wrapper/syntactic sugar.
     def __call__(self, **kwargs):
-        kwargs.setdefault("data_frame", data_manager[self["data_frame"]].load())
+        # An explicit membership test rather than setdefault, since setdefault would evaluate (and hence load the
+        # data for) the default argument even when data_frame is already supplied, which it always is on the
+        # callback path.
+        if "data_frame" not in kwargs:
+            kwargs["data_frame"] = data_manager[self["data_frame"]].load()
         figure = self.figure(**kwargs)
         figure.id = self._input_component_id
         return figure
 
     # Convenience wrapper/syntactic sugar.
     def __getitem__(self, arg_name: str):
-        # See figure implementation for more details.
-        if arg_name == "type":
-            return self.type
-        return self.figure[arg_name]
+        # See figure implementation for more details. A single conditional expression keeps the common
+        # pydantic-driven "type" lookup as cheap as possible.
+        return self.type if arg_name == "type" else self.figure[arg_name]
 
     # Interaction methods
     @property
     def _filter_interaction_input(self):
         """Required properties when using pre-defined `filter_interaction`."""
+        # Imported here rather than at module level to keep dash's heavy import chain off the import time of
+        # vizro.models, which only needs it once a dashboard is actually wired up.
+        from dash import State
+
         return {
             "active_cell": State(component_id=self._input_component_id, component_property="active_cell"),
             "derived_viewport_data": State(
@@ -94,30 +99,66 @@ class Table(VizroBaseModel):
     ) -> pd.DataFrame:
         """Function to be carried out for pre-defined `filter_interaction`."""
         # data_frame is the DF of the target, ie the data to be filtered, hence we cannot get the DF from this model
-        ctd_active_cell = ctd_filter_interaction["active_cell"]
-        ctd_derived_viewport_data = ctd_filter_interaction["derived_viewport_data"]
-        if not ctd_active_cell["value"] or not ctd_derived_viewport_data["value"]:
+        active_cell = ctd_filter_interaction["active_cell"]["value"]
+        derived_viewport_data = ctd_filter_interaction["derived_viewport_data"]["value"]
+        if not active_cell or not derived_viewport_data:
             return data_frame
 
-        # ctd_active_cell["id"] represents the underlying table id, so we need to fetch its parent Vizro Table actions.
-        source_table_actions = _get_component_actions(_get_parent_vizro_model(ctd_active_cell["id"]))
-
-        for action in source_table_actions:
-            if action.function._function.__name__ != "filter_interaction" or target not in action.function["targets"]:
-                continue
-            column = ctd_active_cell["value"]["column_id"]
-            derived_viewport_data_row = ctd_active_cell["value"]["row"]
-            clicked_data = ctd_derived_viewport_data["value"][derived_viewport_data_row][column]
-            data_frame = data_frame[data_frame[column].isin([clicked_data])]
+        # The filter_interaction actions are indexed by target in pre_build, so the actions relevant for target are
+        # found with a single dict lookup rather than by re-inspecting every action on the model per callback.
+        for action in self._filter_interaction_index.get(target, ()):
+            column = active_cell["column_id"]
+            derived_viewport_data_row = active_cell["row"]
+            clicked_data = derived_viewport_data[derived_viewport_data_row][column]
+            # There is exactly one clicked value, so a scalar == comparison does one vectorized pass over the
+            # column rather than the more general isin machinery.
+            data_frame = data_frame[data_frame[column] == clicked_data]
 
         return data_frame
 
     @_log_call
     def pre_build(self):
+        # Invalidate any previously built layout: fields like title and figure remain re-assignable
+        # (validate_assignment=True), and the supported way to pick up such changes is to re-run pre_build. Without
+        # this reset the cached tree would also keep an outdated inner html.Div id after _input_component_id is
+        # recomputed below, leaving callbacks wired against a component that is no longer in the served layout.
+        self._built_layout = None
+
+        # The underlying table id is read straight from the captured arguments rather than by calling the captured
+        # function with an empty data_frame just to inspect the resulting Dash component, which would be rebuilt and
+        # thrown away for every Table on every pre-build.
         self._input_component_id = self.figure._arguments.get("id", f"__input_{self.id}")
 
+        # Index this model's filter_interaction actions by target so that _filter_interaction, which runs on the hot
+        # Dash callback path, does not need to re-inspect every action on every call. Actions are fixed once models
+        # have been built, so the index cannot go stale. Actions without bound targets are ignored, consistent with
+        # _get_action_callback_outputs.
+        # Imported here to avoid pulling dash in at module import time (see _filter_interaction_input).
+        from vizro.actions import filter_interaction
+
+        self._filter_interaction_index = {}
+        for action in _get_component_actions(self):
+            # Identity comparison against the undecorated function, as in _get_action_callback_outputs, instead of
+            # comparing function names.
+            if action.function._function is not filter_interaction.__wrapped__:
+                continue
+            try:
+                action_targets = action.function["targets"]
+            except KeyError:
+                continue
+            for action_target in action_targets:
+                self._filter_interaction_index.setdefault(action_target, []).append(action)
+
     def build(self):
-        return dcc.Loading(
+        # The component tree is assembled once per pre_build and reused if the layout is requested again. pre_build
+        # resets the cache, so mutating fields and re-running pre_build (the supported update pattern) rebuilds it.
+        if self._built_layout is not None:
+            return self._built_layout
+
+        # See _filter_interaction_input for why dash is imported lazily.
+        from dash import dcc, html
+
+        self._built_layout = dcc.Loading(
             children=html.Div(
                 children=[
                     html.H3(self.title, className="figure-title", id=f"{self.id}_title") if self.title else None,
@@ -138,3 +179,4 @@ class Table(VizroBaseModel):
             parent_className="loading-container",
             overlay_style={"visibility": "visible", "opacity": 0.3},
         )
+        return self._built_layout
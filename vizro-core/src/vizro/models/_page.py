@@ -91,6 +91,9 @@ class Page(VizroBaseModel):
             ) from exc
 
     def __vizro_exclude_fields__(self) -> Optional[Union[Set[str], Mapping[str, Any]]]:
+        # Deliberately recomputed on every call rather than cached: id and title remain re-assignable
+        # (validate_assignment=True), and stashing the result in __dict__ would leak into dict() output because
+        # pydantic v1 iterates __dict__ there. It is only called once per model inside _to_python anyway.
         return {"id"} if self.id == self.title else None
 
     @_log_call
@@ -8,6 +8,7 @@ import importlib
 import inspect
 from contextlib import contextmanager
 from datetime import date
+from types import MappingProxyType
 from typing import Any, Dict, List, Literal, Protocol, Union, runtime_checkable
 
 import plotly.io as pio
@@ -162,7 +163,9 @@ class CapturedCallable:
     def _arguments(self):
         # TODO: This is used twice: in _get_parametrized_config and in vm.Action and should be removed when those
         # references are removed.
-        return self.__bound_arguments
+        # Exposed as a read-only view so consumers cannot mutate the bound arguments by accident; mutation must go
+        # through __setitem__.
+        return MappingProxyType(self.__bound_arguments)
 
     # TODO-actions: Find a way how to compare CapturedCallable and function
     @property
@@ -298,18 +298,26 @@ def page_two_captured_callables():
     )
 
 
-@pytest.fixture
-def chart_dynamic():
-    function_string = textwrap.dedent(
+# Compiled once at import time so each fixture instantiation only executes the code object rather than re-dedenting
+# and re-parsing the source. The function is deliberately defined through exec so that inspect.getsource fails for it.
+_CHART_DYNAMIC_CODE = compile(
+    textwrap.dedent(
         """
         @capture("graph")
         def chart_dynamic(data_frame, hover_data: Optional[List[str]] = None):
             return px.bar(data_frame, x="sepal_width", y="sepal_length", hover_data=hover_data)
         """
-    )
+    ),
+    "<chart_dynamic>",
+    "exec",
+)
 
-    exec(function_string)
-    return locals()["chart_dynamic"]
+
+@pytest.fixture
+def chart_dynamic():
+    namespace = {"capture": capture, "px": px, "Optional": Optional, "List": List}
+    exec(_CHART_DYNAMIC_CODE, namespace)
+    return namespace["chart_dynamic"]
 
 
 @pytest.fixture